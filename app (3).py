@@ -9,43 +9,44 @@ import streamlit as st
 import sqlite3
 import os
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import tempfile
+import asyncio
 import base64
 import hashlib
+import hmac
 import random
+import threading
 import uuid
 from datetime import datetime
-from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont
+from itertools import islice
+from fpdf import FPDF
 
 # --- Streamlit Config ---
 st.set_page_config(page_title="Ky'ra Internship Dashboard", layout="wide", initial_sidebar_state="expanded")
-sns.set_style("whitegrid")
-
-# Hide Streamlit branding
-hide_streamlit_style = """
-<style>
-#MainMenu {visibility: hidden;}
-footer {visibility: hidden;}
-header {visibility: hidden;}
-</style>
-"""
-st.markdown(hide_streamlit_style, unsafe_allow_html=True)
 
 # --- Configuration ---
 DB_PATH = os.path.join("/tmp", "internship_tracking.db")
 
+# Report page layout (A4 in points)
+REPORT_PAGE_HEIGHT = 842
+REPORT_TOP = 100
+REPORT_LINE_HEIGHT = 20
+REPORT_BOTTOM_MARGIN = 50
+REPORT_MAX_LINES = (REPORT_PAGE_HEIGHT - REPORT_BOTTOM_MARGIN - REPORT_TOP) // REPORT_LINE_HEIGHT + 1
+
 # Ky'ra Brand Palette
 PRIMARY_COLOR = "#50C878"  # Emerald Green
 ACCENT_COLOR = "#FFD700"   # Soft Gold
 BG_COLOR = "#FAF9F6"       # Light Ivory
 TEXT_COLOR = "#333333"     # Deep Charcoal
 
-# Custom CSS
-st.markdown("""
+# Custom CSS (also hides Streamlit branding), sent as a single block.
+# It is re-emitted on every run: Streamlit drops elements a rerun does not write again.
+APP_CSS = """
 <style>
+#MainMenu {visibility: hidden;}
+footer {visibility: hidden;}
+header {visibility: hidden;}
 body {font-family: 'Poppins', sans-serif; background-color: #FAF9F6; color: #333333;}
 h1, h2, h3 {color: #50C878; font-weight: 600;}
 .stButton>button {
@@ -63,15 +64,17 @@ h1, h2, h3 {color: #50C878; font-weight: 600;}
 .stMetric {background-color: white; padding: 10px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);}
 </style>
 <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@400;600&display=swap" rel="stylesheet">
-""", unsafe_allow_html=True)
+"""
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # --- Mock Users (Replace with Firebase/Supabase in production) ---
+# Passwords are stored as precomputed SHA-256 hex digests of the demo passwords (see hash_password).
 USERS = {
-    "student@example.com": {"name": "Alice", "password": hashlib.sha256("student123".encode()).hexdigest(), "role": "Student"},
-    "college@example.com": {"name": "Prof. Smith", "password": hashlib.sha256("college123".encode()).hexdigest(), "role": "College"},
-    "msme@example.com": {"name": "MSME Corp", "password": hashlib.sha256("msme123".encode()).hexdigest(), "role": "MSME"},
-    "mentor@example.com": {"name": "Dr. Jones", "password": hashlib.sha256("mentor123".encode()).hexdigest(), "role": "Mentor"},
-    "gov@example.com": {"name": "Gov Official", "password": hashlib.sha256("gov123".encode()).hexdigest(), "role": "Government"}
+    "student@example.com": {"name": "Alice", "password": "703b0a3d6ad75b649a28adde7d83c6251da457549263bc7ff45ec709b0a8448b", "role": "Student"},
+    "college@example.com": {"name": "Prof. Smith", "password": "40ed712a3ab15f830a9e738b58a3e382e5e6263f552f91faebd713b184e8989a", "role": "College"},
+    "msme@example.com": {"name": "MSME Corp", "password": "83d254041da31dde5ca405a8278cbfa2158bfdd3691a9a4c651976327931dfc3", "role": "MSME"},
+    "mentor@example.com": {"name": "Dr. Jones", "password": "236977126d6375b9fa5f7ec7d7d7055cf36741c990d9c788f68a8427b08cdf08", "role": "Mentor"},
+    "gov@example.com": {"name": "Gov Official", "password": "3dc2499b7ec0943c85c3655cf65d3abfba5400ad736f52959f251c97dc859471", "role": "Government"}
 }
 
 GREETINGS = {
@@ -87,6 +90,7 @@ MOTIVATIONAL_PROMPTS = {
     "some_progress": "Great work! You’re moving forward – Ky’ra sees your progress! \U0001F4AA",
     "high_progress": "You’re a star! Keep shining with Ky’ra by your side! \U0001F31F"
 }
+HIGH_PROGRESS_INTERNSHIPS = 3
 
 # --- Authentication ---
 def hash_password(password):
@@ -94,17 +98,19 @@ def hash_password(password):
 
 def authenticate_user(email, password, role):
     user_data = USERS.get(email)
-    if user_data and user_data["password"] == hash_password(password) and user_data["role"] == role:
+    if user_data is None:
+        return None
+    if hmac.compare_digest(user_data["password"], hash_password(password)) and user_data["role"] == role:
         try:
-            with sqlite3.connect(DB_PATH, check_same_thread=False) as conn:
-                cur = conn.cursor()
-                cur.execute("SELECT user_id FROM users WHERE email = ?", (email,))
-                user = cur.fetchone()
+            conn = get_connection()
+            with get_write_lock(), conn:
+                user = conn.execute("SELECT user_id FROM users WHERE email = ?", (email,)).fetchone()
                 if not user:
-                    cur.execute("INSERT INTO users (name, email, role) VALUES (?, ?, ?)", 
-                               (user_data["name"], email, role))
-                    conn.commit()
-                return {"email": email, "name": user_data["name"], "role": role}
+                    conn.execute("INSERT INTO users (name, email, role) VALUES (?, ?, ?)",
+                                 (user_data["name"], email, role))
+            if not user:
+                invalidate_role_caches()
+            return {"email": email, "name": user_data["name"], "role": role}
         except sqlite3.Error as e:
             st.error(f"Database error during authentication: {str(e)}")
             return None
@@ -115,10 +121,21 @@ def authenticate_user(email, password, role):
 def get_connection():
     return sqlite3.connect(DB_PATH, check_same_thread=False)
 
+# Serializes writes on the shared connection across Streamlit sessions. Cached as a resource
+# because Streamlit re-executes this module on every rerun, which would otherwise create a new lock each time.
+@st.cache_resource
+def get_write_lock():
+    return threading.Lock()
+
 @st.cache_data(ttl=3600)
 def initialize_database():
     try:
-        with sqlite3.connect(DB_PATH, check_same_thread=False) as conn:
+        conn = get_connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        with get_write_lock(), conn:
             cur = conn.cursor()
             # Create tables
             cur.execute("""
@@ -132,6 +149,7 @@ def initialize_database():
                 )
             """)
             cur.execute("CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)")
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_users_role ON users(role)")
             
             cur.execute("""
                 CREATE TABLE IF NOT EXISTS projects (
@@ -202,101 +220,95 @@ def initialize_database():
                 )
             """)
             cur.execute("CREATE INDEX IF NOT EXISTS idx_courses_user_id ON courses(user_id)")
-            
-            conn.commit()
     except sqlite3.Error as e:
         st.error(f"Database initialization error: {str(e)}")
         raise
 
+# Per-email version counters. fetch_user_data is keyed on (email, version), so bumping one
+# email's version after a write re-fetches only that user instead of clearing every user's entry.
+# Cached as a resource so the counters survive reruns and are shared by all sessions.
+@st.cache_resource
+def get_user_data_versions():
+    return {}
+
+def invalidate_user_data(email):
+    versions = get_user_data_versions()
+    with get_write_lock():
+        versions[email] = versions.get(email, 0) + 1
+
+def user_data_version(email):
+    return get_user_data_versions().get(email, 0)
+
 @st.cache_data(ttl=300)
-def fetch_user_data(email):
+def fetch_user_data(email, version=0):
     try:
-        with sqlite3.connect(DB_PATH, check_same_thread=False) as conn:
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT u.user_id, u.name, u.role,
-                       i.company_name, i.duration, i.feedback, i.msme_digitalized,
-                       c.course_name, c.modules_completed, c.total_modules
-                FROM users u
-                LEFT JOIN internships i ON u.user_id = i.user_id
-                LEFT JOIN courses c ON u.user_id = c.user_id
-                WHERE u.email = ?
-            """, (email,))
-            rows = cur.fetchall()
-            
-            if not rows:
-                return None
-                
-            user_id, name, role = rows[0][:3]
-            internships = []
-            courses = []
-            
-            for row in rows:
-                if row[3]:  # Check if internship data exists
-                    internships.append({
-                        "company_name": row[3],
-                        "duration": row[4],
-                        "feedback": row[5],
-                        "msme_digitalized": row[6]
-                    })
-                if row[7]:  # Check if course data exists
-                    courses.append({
-                        "course_name": row[7],
-                        "modules_completed": row[8],
-                        "total_modules": row[9]
-                    })
-            
-            return {
-                "user_id": user_id,
-                "name": name,
-                "role": role,
-                "internships": internships,
-                "courses": courses
-            }
+        conn = get_connection()
+        cur = conn.cursor()
+        cur.row_factory = sqlite3.Row
+        cur.execute("SELECT user_id, name, role FROM users WHERE email = ?", (email,))
+        user = cur.fetchone()
+        
+        if not user:
+            return None
+        
+        # Child tables are queried separately to avoid the internships x courses row blowup of a double JOIN
+        cur.execute("""
+            SELECT company_name, duration, feedback, msme_digitalized
+            FROM internships WHERE user_id = ?
+        """, (user["user_id"],))
+        internships = [dict(row) for row in cur.fetchall()]
+        cur.execute("""
+            SELECT course_name, modules_completed, total_modules
+            FROM courses WHERE user_id = ?
+        """, (user["user_id"],))
+        courses = [dict(row) for row in cur.fetchall()]
+        
+        return {
+            "user_id": user["user_id"],
+            "name": user["name"],
+            "role": user["role"],
+            "internships": internships,
+            "courses": courses
+        }
     except sqlite3.Error as e:
         st.error(f"Error fetching user data: {str(e)}")
         return None
 
 def log_internship(email, company, duration, feedback, msme_digitalized):
     try:
-        with sqlite3.connect(DB_PATH, check_same_thread=False) as conn:
-            cur = conn.cursor()
-            cur.execute("SELECT user_id FROM users WHERE email = ?", (email,))
-            user = cur.fetchone()
-            if not user:
-                name = email.split("@")[0].capitalize()
-                cur.execute("INSERT INTO users (name, email, role) VALUES (?, ?, ?)", (name, email, "Student"))
-                conn.commit()
-                cur.execute("SELECT user_id FROM users WHERE email = ?", (email,))
-                user = cur.fetchone()
-            user_id = user[0]
-            cur.execute("""
+        conn = get_connection()
+        name = email.split("@")[0].capitalize()
+        with get_write_lock(), conn:
+            # users.email is UNIQUE, so this only creates the user on first use
+            conn.execute("INSERT OR IGNORE INTO users (name, email, role) VALUES (?, ?, ?)", (name, email, "Student"))
+            conn.execute("""
                 INSERT INTO internships (user_id, company_name, duration, feedback, msme_digitalized)
-                VALUES (?, ?, ?, ?, ?)
-            """, (user_id, company, duration, feedback, msme_digitalized))
-            conn.commit()
-            fetch_user_data.clear()
-            return True
+                SELECT user_id, ?, ?, ?, ? FROM users WHERE email = ?
+            """, (company, duration, feedback, msme_digitalized, email))
+        invalidate_user_data(email)
+        invalidate_role_caches()
+        return True
     except sqlite3.Error as e:
         st.error(f"Error logging internship: {str(e)}")
         return False
 
 def log_course_progress(email, course_name, modules_completed, total_modules):
     try:
-        with sqlite3.connect(DB_PATH, check_same_thread=False) as conn:
+        conn = get_connection()
+        with get_write_lock(), conn:
             cur = conn.cursor()
             cur.execute("SELECT user_id FROM users WHERE email = ?", (email,))
             user = cur.fetchone()
-            if user:
-                user_id = user[0]
-                cur.execute("""
-                    INSERT OR REPLACE INTO courses (user_id, course_name, modules_completed, total_modules)
-                    VALUES (?, ?, ?, ?)
-                """, (user_id, course_name, modules_completed, total_modules))
-                conn.commit()
-                fetch_user_data.clear()
-                return True
-            return False
+            if not user:
+                return False
+            user_id = user[0]
+            cur.execute("""
+                INSERT OR REPLACE INTO courses (user_id, course_name, modules_completed, total_modules)
+                VALUES (?, ?, ?, ?)
+            """, (user_id, course_name, modules_completed, total_modules))
+        invalidate_user_data(email)
+        invalidate_role_caches()
+        return True
     except sqlite3.Error as e:
         st.error(f"Error logging course progress: {str(e)}")
         return False
@@ -304,117 +316,139 @@ def log_course_progress(email, course_name, modules_completed, total_modules):
 @st.cache_data(ttl=300)
 def fetch_metrics(role):
     try:
-        with sqlite3.connect(DB_PATH, check_same_thread=False) as conn:
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT 
-                    (SELECT COUNT(*) FROM internships WHERE user_id IN (SELECT user_id FROM users WHERE role = ?)) AS total_internships,
-                    (SELECT SUM(msme_digitalized) FROM internships WHERE user_id IN (SELECT user_id FROM users WHERE role = ?)) AS total_msmes,
-                    (SELECT COUNT(*) FROM courses WHERE user_id IN (SELECT user_id FROM users WHERE role = ?)) AS total_courses
-            """, (role, role, role))
-            result = cur.fetchone()
-            return {
-                "total_internships": result[0],
-                "total_msmes": result[1] or 0,
-                "total_courses": result[2]
-            }
+        conn = get_connection()
+        cur = conn.cursor()
+        # Child tables are pre-aggregated per user so the two LEFT JOINs
+        # cannot multiply each other's rows.
+        cur.execute("""
+            SELECT COALESCE(SUM(i.internship_count), 0) AS total_internships,
+                   SUM(i.msme_total) AS total_msmes,
+                   COALESCE(SUM(c.course_count), 0) AS total_courses
+            FROM users u
+            LEFT JOIN (
+                SELECT user_id, COUNT(*) AS internship_count, SUM(msme_digitalized) AS msme_total
+                FROM internships GROUP BY user_id
+            ) i ON u.user_id = i.user_id
+            LEFT JOIN (
+                SELECT user_id, COUNT(*) AS course_count
+                FROM courses GROUP BY user_id
+            ) c ON u.user_id = c.user_id
+            WHERE u.role = ?
+        """, (role,))
+        result = cur.fetchone()
+        return {
+            "total_internships": result[0],
+            "total_msmes": result[1] or 0,
+            "total_courses": result[2]
+        }
     except sqlite3.Error as e:
         st.error(f"Error fetching metrics: {str(e)}")
         return {"total_internships": 0, "total_msmes": 0, "total_courses": 0}
 
+REPORT_COLUMNS = ["name", "email", "company_name", "duration", "feedback", "msme_digitalized"]
+
+# Returns (rows, columns): plain row tuples plus their column names, ready for pd.DataFrame.from_records
 @st.cache_data(ttl=300)
-def fetch_reports(role):
+def fetch_reports(role, limit=100):
     try:
-        with sqlite3.connect(DB_PATH, check_same_thread=False) as conn:
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT u.name, u.email, i.company_name, i.duration, i.feedback, i.msme_digitalized
-                FROM users u
-                LEFT JOIN internships i ON u.user_id = i.user_id
-                WHERE u.role = ?
-                LIMIT 100
-            """, (role,))
-            rows = cur.fetchall()
-            return [{"name": r[0], "email": r[1], "company_name": r[2], "duration": r[3], "feedback": r[4], "msme_digitalized": r[5]} for r in rows]
+        conn = get_connection()
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT u.name, u.email, i.company_name, i.duration, i.feedback, i.msme_digitalized
+            FROM users u
+            LEFT JOIN internships i ON u.user_id = i.user_id
+            WHERE u.role = ?
+            LIMIT ?
+        """, (role, limit))
+        return cur.fetchall(), REPORT_COLUMNS
     except sqlite3.Error as e:
         st.error(f"Error fetching reports: {str(e)}")
-        return []
+        return [], REPORT_COLUMNS
+
+# Role-level reads are cached (cache-aside); writes that change them drop the cached entries
+# so the next render reads fresh data instead of waiting out the TTL.
+def invalidate_role_caches():
+    fetch_metrics.clear()
+    fetch_reports.clear()
+    _ticker_html.clear()
 
 def log_feedback(user_id, rating, comments):
     try:
-        with sqlite3.connect(DB_PATH, check_same_thread=False) as conn:
-            cur = conn.cursor()
-            cur.execute("INSERT INTO feedback (user_id, rating, comments) VALUES (?, ?, ?)", (user_id, rating, comments))
-            conn.commit()
-            return True
+        conn = get_connection()
+        with get_write_lock(), conn:
+            conn.execute("INSERT INTO feedback (user_id, rating, comments) VALUES (?, ?, ?)", (user_id, rating, comments))
+        return True
     except sqlite3.Error as e:
         st.error(f"Error logging feedback: {str(e)}")
         return False
 
 # --- API Integration (Placeholder) ---
+# The real call goes here as a non-blocking request (e.g. httpx.AsyncClient().post(...)).
+async def _query_kyra_api_async(prompt, user_id):
+    return "Ky’ra: This is a placeholder response. The API is currently disabled for testing."
+
+# Streamlit cannot cache coroutines, so the cached entry point drives the async call to completion.
 @st.cache_data(ttl=300)
 def query_kyra_api(prompt, user_id):
-    return "Ky’ra: This is a placeholder response. The API is currently disabled for testing."
+    return asyncio.run(_query_kyra_api_async(prompt, user_id))
 
-# --- Report Generation (Using PIL for simple image-based report) ---
-def generate_pdf_report(report_data):
+# --- Report Generation (Text written straight into a PDF with fpdf2) ---
+def generate_pdf_report(report_rows):
     try:
-        width, height = 595, 842  # A4 size in pixels at 72 DPI
-        img = Image.new('RGB', (width, height), color='white')
-        draw = ImageDraw.Draw(img)
-        font = ImageFont.load_default()
+        # Only the rows that fit on the page are formatted
+        lines = [
+            f"Name: {name}, Company: {company_name or 'N/A'}, Duration: {duration or 'N/A'}"
+            for name, _email, company_name, duration, _feedback, _msme_digitalized in islice(report_rows, REPORT_MAX_LINES)
+        ]
         
-        draw.text((100, 50), "Ky'ra Internship Report", fill='black', font=font)
+        pdf = FPDF(unit="pt", format="A4")
+        pdf.set_auto_page_break(False)
+        pdf.add_page()
+        pdf.set_font("Helvetica", size=10)
         
-        y = 100
-        for entry in report_data:
-            text = f"Name: {entry['name']}, Company: {entry['company_name'] or 'N/A'}, Duration: {entry['duration'] or 'N/A'}"
-            draw.text((100, y), text, fill='black', font=font)
-            y += 20
-            if y > height - 50:
-                break
+        pdf.text(100, 50, "Ky'ra Internship Report")
         
-        buffer = BytesIO()
-        img.save(buffer, format="PNG")
-        pdf_buffer = BytesIO()
-        pdf_img = Image.open(buffer)
-        pdf_img.save(pdf_buffer, format="PDF")
+        for i, line in enumerate(lines):
+            # Core PDF fonts are Latin-1 only
+            pdf.text(100, REPORT_TOP + i * REPORT_LINE_HEIGHT, line.encode("latin-1", "replace").decode("latin-1"))
         
-        return pdf_buffer.getvalue()
+        return bytes(pdf.output())
     except Exception as e:
         st.error(f"Error generating PDF: {str(e)}")
         return None
 
 # --- Dashboard Rendering ---
-def render_ticker():
-    metrics = fetch_metrics("Student")
-    ticker_html = """
+# Placeholders are fetch_metrics() keys, so the metrics dict is formatted in directly
+TICKER_TEMPLATE = """
     <div style='background-color: #f0f2f6; padding: 10px; border-radius: 5px;'>
         <marquee behavior='scroll' direction='left'>
-            \U0001F31F {internships} Internships Completed | \U0001F680 {msmes} MSMEs Supported | \U0001F4DA {courses} Courses Enrolled
+            \U0001F31F {total_internships} Internships Completed | \U0001F680 {total_msmes} MSMEs Supported | \U0001F4DA {total_courses} Courses Enrolled
         </marquee>
     </div>
-    """.format(
-        internships=metrics["total_internships"],
-        msmes=metrics["total_msmes"],
-        courses=metrics["total_courses"]
-    )
-    st.markdown(ticker_html, unsafe_allow_html=True)
+    """
+
+@st.cache_data(ttl=60)
+def _ticker_html():
+    return TICKER_TEMPLATE.format_map(fetch_metrics("Student"))
+
+def render_ticker():
+    st.markdown(_ticker_html(), unsafe_allow_html=True)
+
+def progress_bucket(internship_count):
+    if internship_count >= HIGH_PROGRESS_INTERNSHIPS:
+        return "high_progress"
+    if internship_count > 0:
+        return "some_progress"
+    return "no_progress"
 
 def display_motivational_prompt(user_data, role):
     if role == "Student":
         internships = len(user_data.get("internships", []))
-        if internships >= 3:
-            prompt = MOTIVATIONAL_PROMPTS["high_progress"]
-        elif internships > 0:
-            prompt = MOTIVATIONAL_PROMPTS["some_progress"]
-        else:
-            prompt = MOTIVATIONAL_PROMPTS["no_progress"]
-        st.info(prompt)
+        st.info(MOTIVATIONAL_PROMPTS[progress_bucket(internships)])
 
 def render_student_dashboard(user):
     email = user["email"]
-    user_data = fetch_user_data(email)
+    user_data = fetch_user_data(email, user_data_version(email))
     
     if not user_data:
         st.error("User data not found. Please try logging in again.")
@@ -441,9 +475,7 @@ def render_student_dashboard(user):
         if user_data["internships"]:
             df = pd.DataFrame(user_data["internships"])
             st.dataframe(df)
-            fig, ax = plt.subplots()
-            sns.countplot(x="msme_digitalized", data=df, ax=ax, palette="viridis")
-            st.pyplot(fig)
+            st.bar_chart(df["msme_digitalized"].value_counts().sort_index())
         if user_data["courses"]:
             df = pd.DataFrame(user_data["courses"])
             st.dataframe(df)
@@ -521,9 +553,10 @@ def render_student_dashboard(user):
     elif choice == "Generate Report":
         st.header("📄 Generate Report")
         with st.spinner("Generating your report..."):
-            report_data = fetch_reports("Student")
-            if report_data:
-                pdf_bytes = generate_pdf_report(report_data)
+            # The PDF holds a single page, so only fetch the rows that fit on it
+            report_rows, _ = fetch_reports("Student", limit=REPORT_MAX_LINES)
+            if report_rows:
+                pdf_bytes = generate_pdf_report(report_rows)
                 if pdf_bytes:
                     b64_pdf = base64.b64encode(pdf_bytes).decode()
                     href = f'<a href="data:application/octet-stream;base64,{b64_pdf}" download="internship_report.pdf">📥 Download Report</a>'
@@ -533,6 +566,18 @@ def render_student_dashboard(user):
             else:
                 st.info("No report data available yet.")
 
+# Placeholder figures until these metrics are tracked; drawn once per session so reruns don't change them
+def get_mock_metrics():
+    if "_mock_metrics" not in st.session_state:
+        st.session_state._mock_metrics = {
+            "mentor_sessions": random.randint(10, 50),
+            "mentor_feedback": random.randint(5, 30),
+            "students_matched": random.randint(5, 20),
+            "colleges_onboarded": random.randint(10, 50),
+            "reports_downloaded": random.randint(5, 30)
+        }
+    return st.session_state._mock_metrics
+
 def render_college_dashboard():
     st.header("📊 College Dashboard")
     st.markdown("### Welcome, College! Ky’ra supports your student success.")
@@ -547,37 +592,39 @@ def render_college_dashboard():
     
     st.button("View Student Performance", key="college_cta")
     st.header("Reports")
-    report_data = fetch_reports("Student")
-    if report_data:
-        df = pd.DataFrame(report_data)
+    report_rows, columns = fetch_reports("Student")
+    if report_rows:
+        df = pd.DataFrame.from_records(report_rows, columns=columns)
         st.dataframe(df)
 
 def render_mentor_dashboard():
     st.header("💡 Mentor Dashboard")
     st.markdown("### Welcome, Mentor! Ky’ra values your guidance.")
     metrics = fetch_metrics("Student")
+    mock_metrics = get_mock_metrics()
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("Sessions Conducted", random.randint(10, 50))
+        st.metric("Sessions Conducted", mock_metrics["mentor_sessions"])
     with col2:
-        st.metric("Feedback Logged", random.randint(5, 30))
+        st.metric("Feedback Logged", mock_metrics["mentor_feedback"])
     
     st.button("Guide Your Students", key="mentor_cta")
     st.header("Student Progress")
-    report_data = fetch_reports("Student")
-    if report_data:
-        df = pd.DataFrame(report_data)
+    report_rows, columns = fetch_reports("Student")
+    if report_rows:
+        df = pd.DataFrame.from_records(report_rows, columns=columns)
         st.dataframe(df)
 
 def render_msme_dashboard():
     st.header("🏢 MSME Dashboard")
     st.markdown("### Welcome, MSME! Ky’ra helps you digitize and grow.")
     metrics = fetch_metrics("Student")
+    mock_metrics = get_mock_metrics()
     col1, col2 = st.columns(2)
     with col1:
         st.metric("Projects Received", metrics.get("total_msmes", 0))
     with col2:
-        st.metric("Students Matched", random.randint(5, 20))
+        st.metric("Students Matched", mock_metrics["students_matched"])
     
     st.header("Digitalization Tasks")
     with st.form("msme_task_form"):
@@ -591,19 +638,20 @@ def render_government_dashboard():
     st.header("🏛️ Government Dashboard")
     st.markdown("### Welcome, Government! Ky’ra tracks your impact.")
     metrics = fetch_metrics("Student")
+    mock_metrics = get_mock_metrics()
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Colleges Onboarded", random.randint(10, 50))
+        st.metric("Colleges Onboarded", mock_metrics["colleges_onboarded"])
     with col2:
         st.metric("Total Engagement", metrics.get("total_internships", 0))
     with col3:
-        st.metric("Reports Downloaded", random.randint(5, 30))
+        st.metric("Reports Downloaded", mock_metrics["reports_downloaded"])
     
     st.button("View Regional Impact", key="gov_cta")
     st.header("Program Reports")
-    report_data = fetch_reports("Student")
-    if report_data:
-        df = pd.DataFrame(report_data)
+    report_rows, columns = fetch_reports("Student")
+    if report_rows:
+        df = pd.DataFrame.from_records(report_rows, columns=columns)
         st.dataframe(df)
 
 def render_dashboard(user, role):